@@ -1,8 +1,13 @@
 import os
 import asyncio
+import functools
+import operator
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
 
 from src.api.client import ReadwiseClient
 from src.db.mongo_client import MongoDBClient
@@ -25,22 +30,171 @@ COMPONENT_WEIGHTS = {
     "engagement_potential": 0.15,
 }
 
+# Quality is not analyzed yet, so every article gets the same quality score
+DEFAULT_QUALITY_SCORE = 7.0
+
+# Weights unpacked once so the per-article priority score is plain arithmetic
+(
+    QUALITY_WEIGHT,
+    INFORMATION_DENSITY_WEIGHT,
+    READABILITY_WEIGHT,
+    TOPIC_RELEVANCE_WEIGHT,
+    FRESHNESS_WEIGHT,
+    ENGAGEMENT_POTENTIAL_WEIGHT,
+) = operator.itemgetter(
+    "quality",
+    "information_density",
+    "readability",
+    "topic_relevance",
+    "freshness",
+    "engagement_potential",
+)(COMPONENT_WEIGHTS)
+
+# Freshness category for an article's top topic
+TOPIC_TO_CATEGORY = {
+    "technology": "technology",
+    "science": "science",
+    "politics": "news",
+    "business": "news",
+    "finance": "news",
+    "education": "evergreen",
+    "health": "evergreen",
+}
+
+# Number of analyzed articles to accumulate before writing them to MongoDB
+WRITE_BATCH_SIZE = 500
+WRITE_FLUSH_INTERVAL = 1.0  # seconds
+WRITE_QUEUE_SIZE = 2000
+
+# Maximum number of documents being analyzed at the same time
+ANALYSIS_CONCURRENCY = 500
+
+# Maximum number of ids per MongoDB $in query
+ID_QUERY_BATCH_SIZE = 1000
+
+# Short sample run through every analyzer when a worker process starts
+WARMUP_TEXT = (
+    "Warmup article. This text is analyzed once per worker so the first "
+    "real article does not pay for loading analyzer data."
+)
+
+@functools.lru_cache(maxsize=None)
+def _get_analyzers() -> tuple:
+    """Return this process's analyzer instances, creating them on first use"""
+    return (
+        ReadabilityAnalyzer(),
+        InformationDensityAnalyzer(),
+        TopicRelevanceAnalyzer(),
+        FreshnessAnalyzer(),
+        EngagementAnalyzer(),
+    )
+
+def _warmup() -> None:
+    """Create and exercise the analyzers in a freshly started worker process"""
+    try:
+        run_all_analyzers(WARMUP_TEXT, "Warmup", None, "default")
+    except Exception as e:
+        # A failing warmup must not break the pool; the article will surface the error
+        logger.warning(f"Analyzer warmup failed: {str(e)}")
+
+def run_all_analyzers(
+    content: str, title: str, published_date: Optional[datetime], category: str
+) -> Tuple[Dict[str, Any], ...]:
+    """Run every CPU-bound analyzer on the extracted content.
+
+    Executed in a worker process so analysis does not block the event loop.
+    Returns the readability, information density, topic relevance,
+    freshness and engagement metrics, in that order.
+    """
+    (
+        readability_analyzer,
+        information_density_analyzer,
+        topic_relevance_analyzer,
+        freshness_analyzer,
+        engagement_analyzer,
+    ) = _get_analyzers()
+    
+    readability_metrics = readability_analyzer.analyze(content)
+    density_metrics = information_density_analyzer.analyze(content)
+    topic_metrics = topic_relevance_analyzer.analyze(content)
+    
+    # Determine category for freshness analysis
+    if topic_metrics.get("top_topics"):
+        category = TOPIC_TO_CATEGORY.get(topic_metrics["top_topics"][0], category)
+    
+    freshness_metrics = freshness_analyzer.analyze(content, published_date, category)
+    engagement_metrics = engagement_analyzer.analyze(content, title)
+    
+    return readability_metrics, density_metrics, topic_metrics, freshness_metrics, engagement_metrics
+
+def chunked(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield consecutive slices of at most size items"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def to_datetime(value: Any, default: Optional[datetime] = None) -> Optional[datetime]:
+    """Convert an ISO 8601 string from the Readwise API to a datetime, passing datetimes through"""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value) if value else default
+    return default if value is None else value
+
+async def flush_updates(collection, operations: List[UpdateOne]) -> None:
+    """Write pending article updates to MongoDB in a single unordered bulk request"""
+    if not operations:
+        return
+    try:
+        result = await collection.bulk_write(operations, ordered=False)
+        logger.info(f"Saved {len(operations)} analyzed articles to MongoDB "
+                    f"(upserted: {result.upserted_count}, modified: {result.modified_count})")
+    except BulkWriteError as e:
+        for error in e.details.get('writeErrors', []):
+            logger.error(f"Error saving article update #{error.get('index')}: {error.get('errmsg')}")
+    except PyMongoError as e:
+        # A failed batch (network error, timeout, ...) is dropped so the writer keeps
+        # draining the queue; its articles are picked up again by the next run
+        logger.error(f"Error saving {len(operations)} analyzed articles to MongoDB: {str(e)}")
+    operations.clear()
+
+async def write_updates(collection, queue: asyncio.Queue) -> None:
+    """Drain article updates from the queue and save them in batches
+
+    A batch is flushed once it reaches WRITE_BATCH_SIZE operations or
+    WRITE_FLUSH_INTERVAL seconds have passed, whichever comes first.
+    Analysis keeps going while a batch is being written. A None item
+    marks the end of the stream.
+    """
+    loop = asyncio.get_running_loop()
+    operations = []
+    deadline = loop.time() + WRITE_FLUSH_INTERVAL
+    done = False
+    while not done:
+        try:
+            operation = await asyncio.wait_for(queue.get(), timeout=max(deadline - loop.time(), 0))
+            if operation is None:
+                done = True
+            else:
+                operations.append(operation)
+        except asyncio.TimeoutError:
+            pass
+        if done or len(operations) >= WRITE_BATCH_SIZE or loop.time() >= deadline:
+            if operations:
+                batch, operations = operations, []
+                await flush_updates(collection, batch)
+            deadline = loop.time() + WRITE_FLUSH_INTERVAL
+
 async def fetch_and_analyze():
-    """Fetch articles from API, analyze them, and save results to MongoDB"""
+    """Fetch articles from API, analyze them, and save results to MongoDB
+
+    Relies on the indexes MongoDBClient creates on the later collection:
+    a unique index on id (for the per-article upserts) and a compound
+    (id, priority_score) index (for the already-analyzed lookup).
+    """
     load_dotenv()
     
     # Initialize clients
     readwise_client = ReadwiseClient(os.getenv('READWISE_TOKEN'))
     mongo_client = MongoDBClient(os.getenv('MONGODB_URI'))
     
-    # Initialize analyzers
-    content_extractor = ContentExtractor()
-    readability_analyzer = ReadabilityAnalyzer()
-    information_density_analyzer = InformationDensityAnalyzer()
-    topic_relevance_analyzer = TopicRelevanceAnalyzer()
-    freshness_analyzer = FreshnessAnalyzer()
-    engagement_analyzer = EngagementAnalyzer()
-    
     # Log database information
     db_name = os.getenv('MONGODB_DATABASE', 'readwise_reader')
     later_collection = os.getenv('MONGODB_LATER_COLLECTION', 'later')
@@ -54,46 +208,55 @@ async def fetch_and_analyze():
     
     # Fetch documents from Readwise API with HTML content
     logger.info("Fetching articles from Readwise API...")
-    documents = readwise_client.fetch_reader_document_list(
-        location='later', 
-        limit=batch_size,
-        with_html_content=True
-    )
+    async with readwise_client:
+        documents = await readwise_client.fetch_reader_document_list(
+            location='later', 
+            limit=batch_size,
+            with_html_content=True
+        )
     
     logger.info(f"Fetched {len(documents)} articles from Readwise API")
     
-    # Check if HTML content is present
-    html_count = sum(1 for doc in documents if doc.get('html_content'))
+    # Collect ids and count articles with HTML content in a single pass
+    article_ids = []
+    html_count = 0
+    for doc in documents:
+        article_ids.append(doc['id'])
+        if doc.get('html_content'):
+            html_count += 1
     logger.info(f"Articles with HTML content: {html_count}/{len(documents)}")
     
     # Check which articles already have analysis in MongoDB
+    await mongo_client.ensure_indexes()
     collection = mongo_client.db[later_collection]
-    article_ids = [doc['id'] for doc in documents]
-    existing_articles = list(collection.find(
-        {"id": {"$in": article_ids}, "priority_score": {"$exists": True}},
-        {"id": 1, "priority_score": 1, "analyzed_at": 1}
-    ))
-    
-    existing_ids = {article['id'] for article in existing_articles}
+    content_cache = await mongo_client.get_content_cache()
+    existing_ids = set()
+    for ids in chunked(article_ids, ID_QUERY_BATCH_SIZE):
+        existing_ids.update(await collection.distinct(
+            "id", {"id": {"$in": ids}, "priority_score": {"$exists": True}}
+        ))
     logger.info(f"Found {len(existing_ids)} articles that already have analysis scores")
     
+    # Drop already-analyzed articles before doing any work on them
+    fetched_count = len(documents)
+    documents = [doc for doc in documents if doc['id'] not in existing_ids]
+    skipped_count = fetched_count - len(documents)
+    logger.info(f"Skipping {skipped_count} already analyzed articles")
+    
     # Now analyze the articles
     logger.info("Starting article analysis...")
     analyzed_count = 0
-    skipped_count = 0
+    write_queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+    extraction_semaphore = asyncio.Semaphore((os.cpu_count() or 1) * 2)
+    analysis_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_warmup)
+    # HTML extraction shares the worker processes with the analyzers
+    content_extractor = ContentExtractor(executor=analysis_pool, cache=content_cache)
+    loop = asyncio.get_running_loop()
     
-    for doc in documents:
+    async def process_document(doc: Dict[str, Any]) -> Optional[UpdateOne]:
+        """Analyze a single document and return its MongoDB update"""
+        nonlocal analyzed_count
         try:
-            # Check if article already has analysis
-            if doc['id'] in existing_ids:
-                existing = next(a for a in existing_articles if a['id'] == doc['id'])
-                analyzed_at = existing.get('analyzed_at')
-                analyzed_time = analyzed_at.strftime('%Y-%m-%d %H:%M:%S') if analyzed_at else 'unknown time'
-                logger.info(f"Skipping article {doc['id']} - {doc.get('title', 'No title')}: "
-                           f"Already analyzed (score: {existing.get('priority_score')}) at {analyzed_time}")
-                skipped_count += 1
-                continue
-            
             # Ensure word_count is an integer
             word_count = 0
             if 'word_count' in doc and doc['word_count'] is not None:
@@ -103,6 +266,7 @@ async def fetch_and_analyze():
                     word_count = 0
             
             # Create Article object with validated word_count
+            now = datetime.now(timezone.utc)
             article = Article(
                 id=doc['id'],
                 readwise_id=doc['id'],
@@ -115,8 +279,8 @@ async def fetch_and_analyze():
                 tags=doc.get('tags', {}),
                 site_name=doc.get('site_name', ''),
                 word_count=word_count,  # Use the validated word_count
-                created_at=datetime.fromisoformat(doc.get('created_at')) if isinstance(doc.get('created_at'), str) else doc.get('created_at', datetime.now(timezone.utc)),
-                updated_at=datetime.fromisoformat(doc.get('updated_at')) if isinstance(doc.get('updated_at'), str) else doc.get('updated_at', datetime.now(timezone.utc)),
+                created_at=to_datetime(doc.get('created_at'), now),
+                updated_at=to_datetime(doc.get('updated_at'), now),
                 published_date=doc.get('published_date'),
                 summary=doc.get('summary'),
                 image_url=doc.get('image_url'),
@@ -125,26 +289,19 @@ async def fetch_and_analyze():
                 notes=doc.get('notes', ''),
                 parent_id=doc.get('parent_id'),
                 reading_progress=doc.get('reading_progress', 0.0),
-                first_opened_at=datetime.fromisoformat(doc['first_opened_at']) if isinstance(doc.get('first_opened_at'), str) and doc.get('first_opened_at') else doc.get('first_opened_at'),
-                last_opened_at=datetime.fromisoformat(doc['last_opened_at']) if isinstance(doc.get('last_opened_at'), str) and doc.get('last_opened_at') else doc.get('last_opened_at'),
-                saved_at=datetime.fromisoformat(doc['saved_at']) if isinstance(doc.get('saved_at'), str) and doc.get('saved_at') else doc.get('saved_at', datetime.now(timezone.utc)),
-                last_moved_at=datetime.fromisoformat(doc['last_moved_at']) if isinstance(doc.get('last_moved_at'), str) and doc.get('last_moved_at') else doc.get('last_moved_at', datetime.now(timezone.utc)),
+                first_opened_at=to_datetime(doc.get('first_opened_at')),
+                last_opened_at=to_datetime(doc.get('last_opened_at')),
+                saved_at=to_datetime(doc.get('saved_at'), now),
+                last_moved_at=to_datetime(doc.get('last_moved_at'), now),
+                html_content=doc.get('html_content') or None,
             )
             
-            # Add HTML content if available
-            if 'html_content' in doc and doc['html_content']:
-                article.html_content = doc['html_content']
-            
-            # Extract content
-            extracted_content = await content_extractor.extract_content(article)
+            # Extract content, bounding how many extractions run at once
+            async with extraction_semaphore:
+                extracted_content = await content_extractor.extract_content(article)
             if not extracted_content:
                 logger.warning(f"Could not extract content for article {article.id}")
-                continue
-            
-            # Run all analysis components
-            readability_metrics = readability_analyzer.analyze(extracted_content)
-            density_metrics = information_density_analyzer.analyze(extracted_content)
-            topic_metrics = topic_relevance_analyzer.analyze(extracted_content)
+                return None
             
             # Get publication date if available
             published_date = None
@@ -156,46 +313,46 @@ async def fetch_and_analyze():
                 except Exception as e:
                     logger.warning(f"Error parsing published_date: {str(e)}")
             
-            # Determine category for freshness analysis
+            # Run all analysis components in a worker process
             category = article.category if article.category else "default"
-            if topic_metrics.get("top_topics"):
-                top_topic = topic_metrics["top_topics"][0] if topic_metrics["top_topics"] else None
-                if top_topic == "technology":
-                    category = "technology"
-                elif top_topic == "science":
-                    category = "science"
-                elif top_topic in ["politics", "business", "finance"]:
-                    category = "news"
-                elif top_topic in ["education", "health"]:
-                    category = "evergreen"
-            
-            freshness_metrics = freshness_analyzer.analyze(
-                extracted_content, published_date, category
-            )
-            
-            engagement_metrics = engagement_analyzer.analyze(
-                extracted_content, article.title
+            (
+                readability_metrics,
+                density_metrics,
+                topic_metrics,
+                freshness_metrics,
+                engagement_metrics,
+            ) = await loop.run_in_executor(
+                analysis_pool, run_all_analyzers,
+                extracted_content, article.title, published_date, category
             )
             
             # Calculate priority score
-            component_scores = {
-                "quality": 7.0,  # Default quality score
-                "information_density": density_metrics.get("normalized_score", 5.0),
-                "readability": readability_metrics.get("normalized_score", 5.0),
-                "topic_relevance": topic_metrics.get("normalized_score", 5.0),
-                "freshness": freshness_metrics.get("normalized_score", 5.0),
-                "engagement_potential": engagement_metrics.get("normalized_score", 5.0),
-            }
+            density_score = density_metrics.get("normalized_score", 5.0)
+            readability_score = readability_metrics.get("normalized_score", 5.0)
+            topic_score = topic_metrics.get("normalized_score", 5.0)
+            freshness_score = freshness_metrics.get("normalized_score", 5.0)
+            engagement_score = engagement_metrics.get("normalized_score", 5.0)
             
-            priority_score = sum(
-                score * COMPONENT_WEIGHTS[component]
-                for component, score in component_scores.items()
+            priority_score = (
+                DEFAULT_QUALITY_SCORE * QUALITY_WEIGHT
+                + density_score * INFORMATION_DENSITY_WEIGHT
+                + readability_score * READABILITY_WEIGHT
+                + topic_score * TOPIC_RELEVANCE_WEIGHT
+                + freshness_score * FRESHNESS_WEIGHT
+                + engagement_score * ENGAGEMENT_POTENTIAL_WEIGHT
             ) * 10  # Scale to 0-100
             
             # When creating the update data, exclude extracted_content
             update_data = {
                 "priority_score": round(priority_score, 1),
-                "component_scores": component_scores,
+                "component_scores": {
+                    "quality": DEFAULT_QUALITY_SCORE,
+                    "information_density": density_score,
+                    "readability": readability_score,
+                    "topic_relevance": topic_score,
+                    "freshness": freshness_score,
+                    "engagement_potential": engagement_score,
+                },
                 "readability": readability_metrics,
                 "information_density": density_metrics,
                 "topic_relevance": topic_metrics,
@@ -204,22 +361,58 @@ async def fetch_and_analyze():
                 "analyzed_at": datetime.now(timezone.utc)
             }
             
-            # Create a clean copy of the document without html_content and extracted_content
-            clean_doc = {k: v for k, v in doc.items() if k != 'html_content'}
-            clean_doc.update(update_data)
-            
-            # Save or update the document in MongoDB
-            collection.update_one(
-                {"id": article.id},
-                {"$set": clean_doc},
-                upsert=True
-            )
+            # Drop html_content in place rather than copying the document; it isn't needed anymore
+            doc.pop('html_content', None)
+            doc.update(update_data)
             
             analyzed_count += 1
-            logger.info(f"Analyzed and saved article: {article.id} - {article.title} (score: {round(priority_score, 1)})")
+            logger.info(f"Analyzed article: {article.id} - {article.title} (score: {round(priority_score, 1)})")
+            
+            return UpdateOne({"id": article.id}, {"$set": doc}, upsert=True)
             
         except Exception as e:
             logger.error(f"Error analyzing article {doc.get('id')}: {str(e)}")
+            return None
+    
+    async def analysis_worker(pending: Iterator[Dict[str, Any]]) -> None:
+        """Analyze documents from the shared iterator until it runs out"""
+        for doc in pending:
+            operation = await process_document(doc)
+            if operation is not None:
+                await write_queue.put(operation)
+    
+    # A fixed set of workers pulls documents from one iterator, so at most
+    # ANALYSIS_CONCURRENCY documents are in flight. Each update goes to the
+    # writer as soon as it is ready, so saving overlaps with the remaining analysis
+    writer = asyncio.create_task(write_updates(collection, write_queue))
+    analysis = None
+    try:
+        async with content_extractor:
+            with analysis_pool:
+                pending = iter(documents)
+                analysis = asyncio.gather(*(
+                    analysis_worker(pending)
+                    for _ in range(min(ANALYSIS_CONCURRENCY, len(documents)))
+                ))
+                done, _ = await asyncio.wait({writer, analysis}, return_when=asyncio.FIRST_COMPLETED)
+                if writer in done:
+                    # The writer only stops before the sentinel on an error; the workers
+                    # would otherwise block for good on the full queue
+                    analysis.cancel()
+                    await asyncio.gather(analysis, return_exceptions=True)
+                    writer.result()
+                await analysis
+    finally:
+        try:
+            if analysis is not None and not analysis.done():
+                analysis.cancel()
+                await asyncio.gather(analysis, return_exceptions=True)
+            # Only a live writer drains the queue, so only then can the sentinel be put
+            if not writer.done():
+                await write_queue.put(None)
+            await writer
+        finally:
+            await mongo_client.close()
     
     logger.info(f"Analysis complete: {analyzed_count} articles analyzed and saved to MongoDB, {skipped_count} skipped")
 
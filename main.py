@@ -1,4 +1,5 @@
 import os
+import asyncio
 from dotenv import load_dotenv
 
 from src.api.client import ReadwiseClient
@@ -19,7 +20,7 @@ def validate_environment():
     if missing_vars:
         raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
 
-def main():
+async def main():
     """Main function to fetch documents and sync with MongoDB"""
     load_dotenv()
     validate_environment()
@@ -33,16 +34,28 @@ def main():
     total_added = 0
     total_removed = 0
     
-    for location in locations:
-        # Fetch documents from Readwise
-        documents = readwise_client.fetch_reader_document_list(location)
-        logger.info(f"{len(documents)} documents fetched from {location}")
-        total_documents += len(documents)
+    sync_tasks = []
+    try:
+        await mongo_client.ensure_indexes()
         
-        # Sync with MongoDB
-        added, removed = mongo_client.sync_documents(location, documents)
-        total_added += added
-        total_removed += removed
+        async with readwise_client:
+            for location in locations:
+                # Fetch documents from Readwise
+                documents = await readwise_client.fetch_reader_document_list(location)
+                logger.info(f"{len(documents)} documents fetched from {location}")
+                total_documents += len(documents)
+                
+                # Sync with MongoDB in the background while the next location is fetched
+                sync_tasks.append(asyncio.create_task(mongo_client.sync_documents(location, documents)))
+        
+        for added, removed in await asyncio.gather(*sync_tasks):
+            total_added += added
+            total_removed += removed
+    finally:
+        # A failed fetch skips the gather above; let syncs of locations that were
+        # fetched completely finish before their client is closed
+        await asyncio.gather(*sync_tasks, return_exceptions=True)
+        await mongo_client.close()
     
     logger.info(f"Sync complete:")
     logger.info(f"Total documents processed: {total_documents}")
@@ -50,4 +63,4 @@ def main():
     logger.info(f"Total documents removed: {total_removed}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
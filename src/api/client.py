@@ -1,48 +1,130 @@
-import os
-from typing import Optional, List, Dict
-import requests
+import asyncio
+from typing import AsyncIterator, Optional, List, Dict, Tuple
+import aiohttp
+import orjson
 import time
-import urllib3
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
+from .exceptions import ReadwiseAPIError
 from ..models.page import Page, Result
 from ..utils.logger import logger
 
+# Retry policy for transient connection failures
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+
+# Retry policy for rate-limited (429) responses
+MAX_RATE_LIMIT_RETRIES = 5
+DEFAULT_RETRY_AFTER_SECONDS = 5
+
+
+def _parse_retry_after(value: Optional[str]) -> int:
+    """Return the seconds to wait for a Retry-After header (delay seconds or an HTTP-date)"""
+    if value is None:
+        return DEFAULT_RETRY_AFTER_SECONDS
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER_SECONDS
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, int((retry_at - datetime.now(timezone.utc)).total_seconds()))
+
+
 class ReadwiseClient:
     def __init__(self, token: str):
         self.token = token
         self.base_url = "https://readwise.io/api/v3/list/"
         self.request_count = 0
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "ReadwiseClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
-    def check_if_rate_limited(self, response: requests.Response) -> bool:
-        """Check if the response indicates rate limiting"""
-        if 'results' not in response.json():
-            wait_time_in_seconds = response.headers['Retry-After']
-            time.sleep(int(wait_time_in_seconds) + 3)
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Lazily create the shared HTTP session used for all requests"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Authorization": f"Token {self.token}"}
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def check_if_rate_limited(self, response: aiohttp.ClientResponse) -> bool:
+        """Check if the response indicates rate limiting, waiting out Retry-After if so"""
+        if response.status == 429:
+            wait_time_in_seconds = _parse_retry_after(response.headers.get('Retry-After')) + 3
+            logger.warning(f"Rate limited by Readwise API, retrying in {wait_time_in_seconds}s")
+            await asyncio.sleep(wait_time_in_seconds)
             return True
         return False
 
-    def make_request(self, params: Dict) -> requests.Response:
-        """Make a request to the Readwise API"""
+    async def make_request(self, params: Dict) -> Tuple[aiohttp.ClientResponse, Dict]:
+        """Make a request to the Readwise API and return the response with its parsed body
+
+        Raises:
+            ReadwiseAPIError: If the API keeps rate limiting the request or
+                answers with any other non-2xx status. A failed page must never
+                look like the end of the document list, since syncing removes
+                every stored document that wasn't fetched.
+        """
         self.request_count += 1
-        
+
         # Log basic request info
         with_html = 'withHtmlContent' in params and params['withHtmlContent'] == 'true'
         logger.info(f"Making Readwise API request #{self.request_count}: with_html={with_html}")
-        
-        start_time = time.time()
-        response = requests.get(
-            url=self.base_url,
-            params=params,
-            headers={"Authorization": f"Token {self.token}"},
-            verify=False
-        )
-        elapsed_time = time.time() - start_time
-        
-        # Log basic response info
-        status = response.status_code
-        logger.info(f"Received response #{self.request_count}: status={status}, time={elapsed_time:.2f}s")
-        
-        return response
+
+        rate_limit_retries = 0
+        while True:
+            start_time = time.time()
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    async with self.session.get(self.base_url, params=params) as response:
+                        body = await response.read()
+                    break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt == MAX_RETRIES:
+                        raise
+                    delay = RETRY_BACKOFF_FACTOR * (2 ** attempt)
+                    logger.warning(f"Request #{self.request_count} failed ({e!r}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+            elapsed_time = time.time() - start_time
+
+            # Log basic response info
+            status = response.status
+            logger.info(f"Received response #{self.request_count}: status={status}, time={elapsed_time:.2f}s")
+
+            # Rate limiting is signalled by the status code, so the body is never parsed for it
+            if status == 429 and rate_limit_retries >= MAX_RATE_LIMIT_RETRIES:
+                raise ReadwiseAPIError(
+                    f"Request #{self.request_count} still rate limited after {MAX_RATE_LIMIT_RETRIES} retries"
+                )
+            if not await self.check_if_rate_limited(response):
+                break
+            rate_limit_retries += 1
+
+        if not 200 <= status < 300:
+            raise ReadwiseAPIError(
+                f"Request #{self.request_count} failed with status {status}: {body[:200]!r}"
+            )
+
+        # Parse the body exactly once; pages with html_content can be several MB
+        return response, orjson.loads(body)
 
     def calculate_params(self, next_page_cursor: Optional[str], location: str, with_html_content: bool = False) -> Dict:
         """Calculate request parameters"""
@@ -55,73 +137,63 @@ class ReadwiseClient:
             params['withHtmlContent'] = 'true'
         return params
 
-    def fetch_reader_document_list(self, location: str, limit: int = None, with_html_content: bool = False) -> List[Dict]:
-        """Fetch documents from the Readwise Reader API for a given location
-        
+    async def iter_reader_documents(self, location: str, limit: int = None, with_html_content: bool = False) -> AsyncIterator[List[Dict]]:
+        """Yield documents from the Readwise Reader API one page at a time
+
+        Lets callers process or persist each page as it arrives instead of
+        holding the whole (possibly html_content-laden) result set in memory.
+
         Args:
             location: The location to fetch documents from ('later', 'archive', etc.)
             limit: Maximum number of documents to fetch (None for all)
             with_html_content: Whether to include HTML content in the response
         """
-        urllib3.disable_warnings()
-        full_data = []
+        fetched = 0
         next_page_cursor = None
         page_count = 0
-        
+
         logger.info(f"Starting document fetch: location={location}, limit={limit}, with_html={with_html_content}")
-        
-        while True:
-            # If we already have enough data, break early
-            if limit is not None and len(full_data) >= limit:
-                break
-            
-            # Calculate how many more items we need if there's a limit
-            remaining = None
-            if limit is not None:
-                remaining = limit - len(full_data)
-                if remaining <= 0:
-                    break
-            
+
+        while limit is None or fetched < limit:
             page_count += 1
-            
+
             params = self.calculate_params(next_page_cursor, location, with_html_content)
-            response = self.make_request(params)
-            
-            if self.check_if_rate_limited(response):
-                response = self.make_request(params)
-            
-            results = response.json().get('results', [])
-            
-            # Only add up to the limit
-            if limit is not None and len(full_data) + len(results) > limit:
-                results = results[:remaining]
-            
-            full_data.extend(results)
-            
-            # If we've reached the limit or there's no next page, break
-            if limit is not None and len(full_data) >= limit:
-                break
-            
-            next_page_cursor = response.json().get('nextPageCursor')
+            _, response_json = await self.make_request(params)
+            results = response_json.get('results', [])
+
+            # Only yield up to the limit
+            if limit is not None:
+                results = results[:limit - fetched]
+
+            fetched += len(results)
+            yield results
+
+            next_page_cursor = response_json.get('nextPageCursor')
             if not next_page_cursor:
                 break
-        
-        logger.info(f"Fetch complete: {len(full_data)} documents retrieved in {page_count} pages")
+
+        logger.info(f"Fetch complete: {fetched} documents retrieved in {page_count} pages")
+
+    async def fetch_reader_document_list(self, location: str, limit: int = None, with_html_content: bool = False) -> List[Dict]:
+        """Fetch documents from the Readwise Reader API for a given location
+
+        Args:
+            location: The location to fetch documents from ('later', 'archive', etc.)
+            limit: Maximum number of documents to fetch (None for all)
+            with_html_content: Whether to include HTML content in the response
+        """
+        full_data = []
+        async for results in self.iter_reader_documents(location, limit, with_html_content):
+            full_data.extend(results)
         return full_data
 
-    def fetch_single_page(self, next_page_cursor: Optional[str] = None, location: str = 'later') -> Optional[Page]:
+    async def fetch_single_page(self, next_page_cursor: Optional[str] = None, location: str = 'later') -> Optional[Page]:
         """Fetch a single page of results from the Readwise Reader API"""
-        urllib3.disable_warnings()
         params = self.calculate_params(next_page_cursor, location)
-        response = self.make_request(params)
-        
-        if self.check_if_rate_limited(response):
-            response = self.make_request(params)
+        _, response_json = await self.make_request(params)
 
-        response_json = response.json()
-        
         return Page(
             count=response_json['count'],
             nextPageCursor=response_json['nextPageCursor'],
             results=[Result(**result) for result in response_json['results']]
-        )
\ No newline at end of file
+        )
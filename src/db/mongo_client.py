@@ -1,59 +1,136 @@
-from typing import List, Dict, Tuple
-from pymongo import MongoClient
+from typing import Any, List, Dict, Tuple
+from pymongo import AsyncMongoClient
+from pymongo.errors import BulkWriteError, OperationFailure
 import os
+import time
 from ..utils.logger import logger
 
+# How long extracted article content stays in the content cache
+CONTENT_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Maximum number of documents per insert request, keeping batches well under 16MB
+INSERT_BATCH_SIZE = 1000
+
+# How long collection counts and stats are reused before asking MongoDB again
+STATS_CACHE_TTL_SECONDS = 30
+
 class MongoDBClient:
     def __init__(self, connection_string: str):
-        self.client = MongoClient(connection_string)
+        # Compress traffic (documents can carry full page HTML) and acknowledge writes
+        # from the primary only; syncs are idempotent and simply rerun on failure
+        self.client = AsyncMongoClient(
+            connection_string,
+            compressors='zstd,zlib',
+            zlibCompressionLevel=6,
+            w=1,
+            retryWrites=True,
+            maxPoolSize=50
+        )
         self.db = self.client[os.getenv('MONGODB_DATABASE', 'readwise_reader')]
         self.collections = {
             'later': os.getenv('MONGODB_LATER_COLLECTION', 'later'),
             'archive': os.getenv('MONGODB_ARCHIVE_COLLECTION', 'archive')
         }
+        # (kind, collection name) -> (time cached, value)
+        self._stats_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+
+    async def close(self) -> None:
+        """Close the underlying MongoDB connections"""
+        await self.client.close()
+
+    async def ensure_indexes(self):
+        """Create the indexes used by the sync and analysis lookups (no-op if they exist)"""
+        for name in self.collections.values():
+            try:
+                await self.db[name].create_index('id', unique=True)
+            except OperationFailure as e:
+                logger.warning(f"Could not create unique index on {name}.id: {e}")
+        await self.db[self.collections['later']].create_index([('id', 1), ('priority_score', 1)])
     
-    def sync_documents(self, location: str, documents: List[Dict]):
+    async def sync_documents(self, location: str, documents: List[Dict]):
         """Sync documents with MongoDB collection"""
         collection = self.db[self.collections[location]]
         
-        # Get existing document IDs
-        existing_ids = {doc['id'] for doc in collection.find({}, {'id': 1})}
-        new_ids = {doc['id'] for doc in documents}
+        # Only look up the incoming ids that are already stored instead of downloading every id
+        incoming_ids = [doc['id'] for doc in documents]
+        present_ids = set(await collection.distinct('id', {'id': {'$in': incoming_ids}}))
         
         # Calculate changes
-        to_insert = [doc for doc in documents if doc['id'] not in existing_ids]
-        to_delete = [doc_id for doc_id in existing_ids if doc_id not in new_ids]
+        to_insert = [doc for doc in documents if doc['id'] not in present_ids]
         
         # Apply changes
-        if to_insert:
-            collection.insert_many(to_insert)
-            logger.info(f"Added {len(to_insert)} new documents to {location}")
+        inserted = 0
+        for i in range(0, len(to_insert), INSERT_BATCH_SIZE):
+            batch = to_insert[i:i + INSERT_BATCH_SIZE]
+            try:
+                result = await collection.insert_many(batch, ordered=False)
+                inserted += len(result.inserted_ids)
+            except BulkWriteError as e:
+                inserted += e.details.get('nInserted', 0)
+                for error in e.details.get('writeErrors', []):
+                    logger.error(f"Error inserting document into {location}: {error.get('errmsg')}")
+        if inserted:
+            logger.info(f"Added {inserted} new documents to {location}")
             
-        if to_delete:
-            collection.delete_many({'id': {'$in': to_delete}})
-            logger.info(f"Removed {len(to_delete)} documents from {location}")
+        # Let the server find and remove documents that are no longer in the location
+        result = await collection.delete_many({'id': {'$nin': incoming_ids}})
+        removed = result.deleted_count
+        if removed:
+            logger.info(f"Removed {removed} documents from {location}")
             
-        return len(to_insert), len(to_delete)
+        self._invalidate_stats(collection.name)
+        return inserted, removed
 
-    def get_collection_stats(self, collection_name: str) -> Dict:
+    def _get_cached_stat(self, kind: str, collection_name: str):
+        """Return a cached count or stats value if it is still fresh, otherwise None"""
+        entry = self._stats_cache.get((kind, collection_name))
+        if entry and time.monotonic() - entry[0] < STATS_CACHE_TTL_SECONDS:
+            return entry[1]
+        return None
+
+    def _set_cached_stat(self, kind: str, collection_name: str, value: Any) -> None:
+        """Remember a count or stats value for STATS_CACHE_TTL_SECONDS"""
+        self._stats_cache[(kind, collection_name)] = (time.monotonic(), value)
+
+    def _invalidate_stats(self, collection_name: str) -> None:
+        """Drop cached counts and stats for a collection that was just modified"""
+        for key in [key for key in self._stats_cache if key[1] == collection_name]:
+            del self._stats_cache[key]
+
+    async def get_content_cache(self):
+        """Get the collection caching extracted article content keyed by HTML hash"""
+        collection = self.db[os.getenv('MONGODB_CONTENT_CACHE_COLLECTION', 'content_cache')]
+        await collection.create_index('cached_at', expireAfterSeconds=CONTENT_CACHE_TTL_SECONDS)
+        return collection
+
+    async def get_collection_stats(self, collection_name: str) -> Dict:
         """Get statistics for a collection"""
         if collection_name not in self.collections:
             collection_name = os.getenv(f'MONGODB_{collection_name.upper()}_COLLECTION', collection_name)
         
-        collection = self.db[collection_name]
+        stats = self._get_cached_stat('stats', collection_name)
+        if stats is not None:
+            return stats
+        
+        # collStats already reports the document count alongside the sizes
+        collection_stats = await self.db.command('collstats', collection_name)
         
         stats = {
-            'document_count': collection.count_documents({}),
-            'size': self.db.command('collstats', collection_name).get('size', 0),
-            'avg_document_size': self.db.command('collstats', collection_name).get('avgObjSize', 0)
+            'document_count': collection_stats.get('count', 0),
+            'size': collection_stats.get('size', 0),
+            'avg_document_size': collection_stats.get('avgObjSize', 0)
         }
         
+        self._set_cached_stat('stats', collection_name, stats)
         return stats 
 
-    def get_document_count(self, collection_name: str) -> int:
+    async def get_document_count(self, collection_name: str) -> int:
         """Get the number of documents in a collection"""
         if collection_name not in self.collections:
             collection_name = os.getenv(f'MONGODB_{collection_name.upper()}_COLLECTION', collection_name)
         
-        collection = self.db[collection_name]
-        return collection.count_documents({}) 
\ No newline at end of file
+        count = self._get_cached_stat('count', collection_name)
+        if count is None:
+            count = await self.db[collection_name].estimated_document_count()
+            self._set_cached_stat('count', collection_name, count)
+        return count 
\ No newline at end of file
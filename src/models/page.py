@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional, Dict
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Result:
     id: str
     url: str
@@ -29,7 +29,7 @@ class Result:
     last_moved_at: Optional[str]
     html_content: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Page:
     count: int
     nextPageCursor: str
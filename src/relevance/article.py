@@ -4,6 +4,8 @@ from pydantic import BaseModel, Field, ConfigDict
 
 
 class ComponentScores(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     quality: float = 7.0
     information_density: float = 5.0
     readability: float = 5.0
@@ -13,6 +15,8 @@ class ComponentScores(BaseModel):
 
 
 class ReadabilityMetrics(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     flesch_reading_ease: float
     smog_index: float
     coleman_liau_index: float
@@ -22,6 +26,8 @@ class ReadabilityMetrics(BaseModel):
 
 
 class InformationDensityMetrics(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     lexical_diversity: float
     fact_density: float
     concept_density: float
@@ -30,12 +36,16 @@ class InformationDensityMetrics(BaseModel):
 
 
 class TopicRelevanceMetrics(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     top_topics: List[str]
     topic_matches: Dict[str, float]
     normalized_score: float
 
 
 class FreshnessMetrics(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     age_days: int
     temporal_references_count: int
     decay_rate: int
@@ -44,12 +54,16 @@ class FreshnessMetrics(BaseModel):
 
 
 class EmotionCounts(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     positive: int = 0
     negative: int = 0
     surprise: int = 0
 
 
 class EngagementMetrics(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     emotional_score: float
     narrative_score: float
     visual_score: float
@@ -65,7 +79,9 @@ class Article(BaseModel):
     """
 
     model_config = ConfigDict(
-        populate_by_name=True, json_encoders={datetime: lambda v: v.isoformat()}
+        populate_by_name=True,
+        extra="ignore",
+        json_encoders={datetime: lambda v: v.isoformat()},
     )
 
     id: str = Field(default=None, alias="_id")
@@ -1,11 +1,38 @@
+import asyncio
+import hashlib
+import os
 import trafilatura
 import httpx
-from typing import Optional
+from trafilatura.settings import use_config
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 from src.relevance.article import Article
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Built once per process instead of re-reading trafilatura's settings file on every call.
+# The signal-based extraction timeout is disabled since extraction runs in executor workers.
+TRAFILATURA_CONFIG = use_config()
+TRAFILATURA_CONFIG.set("DEFAULT", "EXTRACTION_TIMEOUT", "0")
+
+# Content kept per extractor for recently fetched source URLs, least recently
+# used evicted first; the Mongo-backed HTML cache covers reuse across runs
+URL_CACHE_SIZE = 256
+
+
+def _extract_with_trafilatura(html: str) -> Optional[str]:
+    """
+    Extract the main text of an HTML document.
+
+    Text without any markup is already extracted and is returned as is,
+    skipping the lxml parse entirely.
+    """
+    if "<" not in html:
+        return html.strip() or None
+    return trafilatura.extract(html, config=TRAFILATURA_CONFIG, fast=True)
+
 
 class ContentExtractor:
     """
@@ -16,14 +43,100 @@ class ContentExtractor:
     4. Use summary field if no other content is accessible
     """
 
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: int = 10,
+        executor: Optional[Executor] = None,
+        cache: Optional[Any] = None,
+    ):
         """
         Initialize the content extractor with a timeout for HTTP requests.
 
         Args:
             timeout: Maximum time in seconds to wait for HTTP response
+            executor: Executor used to run trafilatura off the event loop.
+                If omitted, a process pool is created on first use and shut
+                down by aclose().
+            cache: Optional async MongoDB collection mapping a hash of
+                html_content to the content extracted from it, so unchanged
+                HTML is not parsed again on later runs
         """
         self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._executor = executor
+        self._owns_executor = executor is None
+        self.cache = cache
+        # Content recently fetched from source URLs, so repeated URLs are fetched once
+        self._url_cache: Dict[str, str] = {}
+
+    async def __aenter__(self) -> "ContentExtractor":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Lazily create the HTTP client shared by all source_url fetches.
+
+        Reusing one client keeps connections alive between articles instead
+        of paying a new TCP/TLS handshake for every URL.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+        return self._client
+
+    @property
+    def executor(self) -> Executor:
+        """Executor that runs trafilatura, created on first use if none was given."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._executor
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and any executor this extractor created."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def _extract_html(self, html: str) -> Optional[str]:
+        """
+        Run trafilatura on an HTML document in the executor.
+
+        Parsing is CPU-bound, so running it inline would block the event loop
+        and serialize every concurrent extraction on one core.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _extract_with_trafilatura, html)
+
+    async def _extract_html_cached(self, html: str) -> Optional[str]:
+        """
+        Extract content from HTML, reusing earlier results for identical HTML.
+
+        Falls back to plain extraction when no cache collection was given.
+        """
+        if self.cache is None:
+            return await self._extract_html(html)
+
+        html_hash = hashlib.blake2b(html.encode(), digest_size=16).hexdigest()
+        cached = await self.cache.find_one({"_id": html_hash}, {"content": 1})
+        if cached:
+            return cached["content"]
+
+        content = await self._extract_html(html)
+        if content:
+            await self.cache.update_one(
+                {"_id": html_hash},
+                {"$set": {"content": content, "cached_at": datetime.now(timezone.utc)}},
+                upsert=True,
+            )
+        return content
 
     async def extract_content(self, article: Article) -> Optional[str]:
         """
@@ -38,7 +151,7 @@ class ContentExtractor:
         # Strategy 0: Use HTML content from html_content attribute (from later_html collection)
         if hasattr(article, "html_content") and article.html_content:
             try:
-                content = trafilatura.extract(article.html_content)
+                content = await self._extract_html_cached(article.html_content)
                 if content:
                     logger.info(
                         f"Content extracted from later_html for article {article.id}"
@@ -76,6 +189,27 @@ class ContentExtractor:
         logger.warning(f"No content could be extracted for article {article.id}")
         return None
 
+    async def extract_many(
+        self, articles: List[Article], concurrency: int = 32
+    ) -> List[Optional[str]]:
+        """
+        Extract content from many articles concurrently.
+
+        Args:
+            articles: The articles to extract content from
+            concurrency: Maximum number of extractions running at once
+
+        Returns:
+            Extracted content for each article, in the same order as articles
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def extract_one(article: Article) -> Optional[str]:
+            async with semaphore:
+                return await self.extract_content(article)
+
+        return await asyncio.gather(*(extract_one(article) for article in articles))
+
     async def _fetch_from_url(self, url: str) -> Optional[str]:
         """
         Fetch and extract content from a URL using trafilatura.
@@ -86,14 +220,23 @@ class ContentExtractor:
         Returns:
             Extracted content as string or None if extraction failed
         """
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+        content = self._url_cache.pop(url, None)
+        if content is not None:
+            # Re-insert so the entry becomes the most recently used
+            self._url_cache[url] = content
+            return content
 
-                # Use trafilatura to extract the main content
-                content = trafilatura.extract(response.text)
-                return content
+        try:
+            response = await self.client.get(url)
+            response.raise_for_status()
+
+            # Use trafilatura to extract the main content
+            content = await self._extract_html(response.text)
+            if content:
+                if len(self._url_cache) >= URL_CACHE_SIZE:
+                    del self._url_cache[next(iter(self._url_cache))]
+                self._url_cache[url] = content
+            return content
         except httpx.TimeoutException:
             logger.warning(f"Timeout while fetching content from {url}")
             return None
@@ -1,31 +1,195 @@
 import re
 import math
-import nltk
 from collections import Counter
-from typing import Dict, Any, List, Set, Tuple
+from concurrent.futures import Executor
+from typing import Dict, Any, List, Optional, Set, Tuple
 import logging
-import os
 import string
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-# Create NLTK data directory if it doesn't exist
-nltk_data_dir = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "nltk_data"
+# Sentences, as the runs of text between sentence terminators
+SENTENCE_PATTERN = re.compile(r"[^.!?]+")
+
+# Words of three or more letters; the Polish pattern includes Polish characters
+WORD_PATTERN_EN = re.compile(r"\b[a-zA-Z]{3,}\b")
+WORD_PATTERN_PL = re.compile(r"\b[a-zA-ZąćęłńóśźżĄĆĘŁŃÓŚŹŻ]{3,}\b")
+
+# Any word, used by the fallback tokenization
+FALLBACK_WORD_PATTERN = re.compile(r"\b\w+\b")
+
+# Weights of the metrics in the normalized score
+LEXICAL_DIVERSITY_WEIGHT = 0.4  # Lexical diversity is most important
+FACT_DENSITY_WEIGHT = 0.4  # Facts are equally important
+CONCEPT_DENSITY_WEIGHT = 0.2  # Concept density is less important
+
+# Articles handed to each executor task by analyze_batch
+BATCH_CHUNK_SIZE = 64
+
+# Common stop words in multiple languages (English, Polish, etc.), built once
+# and shared by every analyzer instance
+STOP_WORDS = frozenset(
+    {
+        # English stop words
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "is",
+        "are",
+        "was",
+        "were",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "with",
+        "by",
+        "about",
+        "of",
+        "from",
+        "as",
+        "this",
+        "that",
+        "these",
+        "those",
+        "it",
+        "its",
+        "they",
+        "them",
+        "their",
+        "he",
+        "she",
+        "his",
+        "her",
+        "we",
+        "our",
+        "you",
+        "your",
+        # Polish stop words (expanded)
+        "w",
+        "i",
+        "na",
+        "z",
+        "do",
+        "że",
+        "to",
+        "o",
+        "dla",
+        "jest",
+        "nie",
+        "się",
+        "od",
+        "przez",
+        "po",
+        "jak",
+        "co",
+        "lub",
+        "aby",
+        "przy",
+        "tak",
+        "który",
+        "która",
+        "które",
+        "gdy",
+        "być",
+        "ten",
+        "ta",
+        "te",
+        "tego",
+        "tej",
+        "tych",
+        "tym",
+        "temu",
+        "jako",
+        "tylko",
+        "już",
+        "też",
+        "można",
+        "ma",
+        "był",
+        "była",
+        "było",
+        "będzie",
+        "są",
+        "ich",
+        "jego",
+        "jej",
+        "mnie",
+        "mi",
+        "moje",
+        "twoje",
+        "swoje",
+        "nasz",
+        "wasz",
+        "a",
+        "ale",
+        "więc",
+        "bo",
+        "gdyż",
+        "ponieważ",
+        "oraz",
+        "czy",
+        "kiedy",
+        "gdzie",
+        "kto",
+        "co",
+        "który",
+        "jaki",
+        "czyj",
+        "ile",
+        "skąd",
+        "dokąd",
+        "dlaczego",
+        "dlatego",
+        "aby",
+        "żeby",
+        "jeśli",
+        "jeżeli",
+        "gdyby",
+        "niż",
+        "niżeli",
+        "ani",
+        "albo",
+        "lecz",
+        "jednak",
+        "natomiast",
+        "zaś",
+        "zatem",
+        "więc",
+        "toteż",
+        "dlatego",
+        "stąd",
+        "potem",
+        "następnie",
+    }
 )
-os.makedirs(nltk_data_dir, exist_ok=True)
 
-# Set NLTK data path
-nltk.data.path.append(nltk_data_dir)
+# Polish-specific characters, each counted with str.count
+POLISH_CHARS = "ąćęłńóśźżĄĆĘŁŃÓŚŹŻ"
 
-# Download required NLTK resources
-try:
-    # Download punkt tokenizer directly without checking first
-    nltk.download("punkt", download_dir=nltk_data_dir, quiet=True)
-    logger.info("NLTK punkt tokenizer download complete")
-except Exception as e:
-    logger.warning(f"Failed to download NLTK resources: {str(e)}")
-    logger.warning("Will use simple tokenization as fallback")
+
+def _split_sentences(content: str) -> List[str]:
+    """
+    Split the content into stripped, non-blank sentences.
+
+    Args:
+        content: The text content to split
+
+    Returns:
+        List of sentences, without their terminators
+    """
+    # Matching the sentences themselves yields no empty strings between
+    # adjacent terminators, and each sentence is stripped only once
+    return [
+        sentence.strip()
+        for sentence in SENTENCE_PATTERN.findall(content)
+        if not sentence.isspace()
+    ]
 
 
 class InformationDensityAnalyzer:
@@ -64,145 +228,30 @@ class InformationDensityAnalyzer:
         self.fact_patterns = [
             re.compile(pattern, re.IGNORECASE) for pattern in self.fact_patterns
         ]
+        # All fact patterns as one alternation, so a sentence is searched once.
+        # The word boundary most of them start with is factored out and checked
+        # first, which rules out positions inside words before any alternative
+        # is tried; without that the alternation is slower than separate searches
+        bounded = [
+            pattern.pattern[2:]
+            for pattern in self.fact_patterns
+            if pattern.pattern.startswith(r"\b")
+        ]
+        unbounded = [
+            pattern.pattern
+            for pattern in self.fact_patterns
+            if not pattern.pattern.startswith(r"\b")
+        ]
+        self.fact_regex = re.compile(
+            "|".join(
+                [f"(?:{pattern})" for pattern in unbounded]
+                + [r"\b(?:" + "|".join(f"(?:{pattern})" for pattern in bounded) + ")"]
+            ),
+            re.IGNORECASE,
+        )
 
         # Common stop words in multiple languages (English, Polish, etc.)
-        self.stop_words = {
-            # English stop words
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "is",
-            "are",
-            "was",
-            "were",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "with",
-            "by",
-            "about",
-            "of",
-            "from",
-            "as",
-            "this",
-            "that",
-            "these",
-            "those",
-            "it",
-            "its",
-            "they",
-            "them",
-            "their",
-            "he",
-            "she",
-            "his",
-            "her",
-            "we",
-            "our",
-            "you",
-            "your",
-            # Polish stop words (expanded)
-            "w",
-            "i",
-            "na",
-            "z",
-            "do",
-            "że",
-            "to",
-            "o",
-            "dla",
-            "jest",
-            "nie",
-            "się",
-            "od",
-            "przez",
-            "po",
-            "jak",
-            "co",
-            "lub",
-            "aby",
-            "przy",
-            "tak",
-            "który",
-            "która",
-            "które",
-            "gdy",
-            "być",
-            "ten",
-            "ta",
-            "te",
-            "tego",
-            "tej",
-            "tych",
-            "tym",
-            "temu",
-            "jako",
-            "tylko",
-            "już",
-            "też",
-            "można",
-            "ma",
-            "był",
-            "była",
-            "było",
-            "będzie",
-            "są",
-            "ich",
-            "jego",
-            "jej",
-            "mnie",
-            "mi",
-            "moje",
-            "twoje",
-            "swoje",
-            "nasz",
-            "wasz",
-            "a",
-            "ale",
-            "więc",
-            "bo",
-            "gdyż",
-            "ponieważ",
-            "oraz",
-            "czy",
-            "kiedy",
-            "gdzie",
-            "kto",
-            "co",
-            "który",
-            "jaki",
-            "czyj",
-            "ile",
-            "skąd",
-            "dokąd",
-            "dlaczego",
-            "dlatego",
-            "aby",
-            "żeby",
-            "jeśli",
-            "jeżeli",
-            "gdyby",
-            "niż",
-            "niżeli",
-            "ani",
-            "albo",
-            "lecz",
-            "jednak",
-            "natomiast",
-            "zaś",
-            "zatem",
-            "więc",
-            "toteż",
-            "dlatego",
-            "stąd",
-            "potem",
-            "następnie",
-        }
+        self.stop_words = STOP_WORDS
 
     def analyze(self, content: str) -> Dict[str, Any]:
         """
@@ -214,14 +263,150 @@ class InformationDensityAnalyzer:
         Returns:
             Dictionary containing information density metrics and normalized score
         """
+        metrics = self._calculate_metrics(content)
+        if metrics is None:
+            return self._insufficient_content_result()
+
+        lexical_diversity, fact_density, concept_density, key_concepts = metrics
+
+        # Calculate normalized score (1-10)
+        normalized_score = self._calculate_normalized_score(
+            lexical_diversity, fact_density, concept_density
+        )
+
+        return self._build_result(
+            lexical_diversity,
+            fact_density,
+            concept_density,
+            key_concepts,
+            normalized_score,
+        )
+
+    def analyze_batch(
+        self, contents: List[str], executor: Optional[Executor] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze the information density of many articles.
+
+        The metrics are calculated article by article and the normalized scores
+        of the whole batch in one go.
+
+        The regex scans hold the GIL, so spreading a batch over an executor
+        only pays off with a process pool.
+
+        Args:
+            contents: The text contents to analyze
+            executor: Optional executor to analyze chunks of the batch in
+
+        Returns:
+            Information density metrics for each article, in input order
+        """
+        if executor is not None:
+            chunks = [
+                contents[start : start + BATCH_CHUNK_SIZE]
+                for start in range(0, len(contents), BATCH_CHUNK_SIZE)
+            ]
+            return [
+                result
+                for chunk_results in executor.map(self.analyze_batch, chunks)
+                for result in chunk_results
+            ]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(contents)
+        calculated = []
+        for index, content in enumerate(contents):
+            metrics = self._calculate_metrics(content)
+            if metrics is None:
+                results[index] = self._insufficient_content_result()
+            else:
+                calculated.append((index, metrics))
+
+        if not calculated:
+            return results
+
+        # Normalize the whole batch at once
+        components = np.array(
+            [metrics[:3] for _, metrics in calculated], dtype=np.float64
+        )
+        normalized_scores = self.normalize_batch(
+            components[:, 0], components[:, 1], components[:, 2]
+        )
+
+        for (index, metrics), normalized_score in zip(
+            calculated, normalized_scores.tolist()
+        ):
+            results[index] = self._build_result(*metrics, normalized_score)
+
+        return results
+
+    def normalize_batch(
+        self,
+        lexical_diversities: np.ndarray,
+        fact_densities: np.ndarray,
+        concept_densities: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculate normalized information density scores (1-10) for arrays of metrics.
+
+        The metrics are combined in the same order as _calculate_normalized_score,
+        so the results match the single-article scores exactly.
+
+        Args:
+            lexical_diversities: Lexical diversity scores (0-1)
+            fact_densities: Fact density scores (0-1)
+            concept_densities: Concept density scores (0-1)
+
+        Returns:
+            Array of unrounded normalized scores
+        """
+        return 1 + (
+            np.asarray(lexical_diversities, dtype=np.float64) * LEXICAL_DIVERSITY_WEIGHT
+            + np.asarray(fact_densities, dtype=np.float64) * FACT_DENSITY_WEIGHT
+            + np.asarray(concept_densities, dtype=np.float64) * CONCEPT_DENSITY_WEIGHT
+        ) * 9
+
+    def _insufficient_content_result(self) -> Dict[str, Any]:
+        """Return the metrics reported for content too short to analyze."""
+        return {
+            "lexical_diversity": 0,
+            "fact_density": 0,
+            "concept_density": 0,
+            "key_concepts": [],
+            "normalized_score": 5.0,  # Default middle score for insufficient content
+        }
+
+    def _build_result(
+        self,
+        lexical_diversity: float,
+        fact_density: float,
+        concept_density: float,
+        key_concepts: List[str],
+        normalized_score: float,
+    ) -> Dict[str, Any]:
+        """Assemble the rounded information density metrics of an article."""
+        return {
+            "lexical_diversity": round(lexical_diversity, 3),
+            "fact_density": round(fact_density, 3),
+            "concept_density": round(concept_density, 3),
+            "key_concepts": key_concepts[:10],  # Return top 10 concepts
+            "normalized_score": round(normalized_score, 2),
+        }
+
+    def _calculate_metrics(
+        self, content: str
+    ) -> Optional[Tuple[float, float, float, List[str]]]:
+        """
+        Calculate the information density metrics of the content.
+
+        Args:
+            content: The text content to analyze
+
+        Returns:
+            Tuple of (lexical diversity, fact density, concept density, key
+            concepts), or None if the content is too short to analyze
+        """
         if not content or len(content.strip()) < 100:
-            return {
-                "lexical_diversity": 0,
-                "fact_density": 0,
-                "concept_density": 0,
-                "key_concepts": [],
-                "normalized_score": 5.0,  # Default middle score for insufficient content
-            }
+            return None
 
         # Detect if content is likely Polish
         is_polish = self._is_likely_polish(content)
@@ -229,57 +414,56 @@ class InformationDensityAnalyzer:
         # Tokenize content with language-aware tokenization
         try:
             # Use simple regex-based tokenization instead of NLTK
-            sentences = [s.strip() for s in re.split(r"[.!?]+", content) if s.strip()]
+            sentences = _split_sentences(content)
 
-            # Use language-specific word pattern
+            # Use language-specific word pattern; it only matches alphabetic words
+            # and leaves out very short ones, so those need no filtering later
             if is_polish:
                 # Include Polish characters in word pattern
-                words = [
-                    w.lower()
-                    for w in re.findall(r"\b[a-zA-ZąćęłńóśźżĄĆĘŁŃÓŚŹŻ]+\b", content)
-                ]
+                word_pattern = WORD_PATTERN_PL
             else:
-                words = [w.lower() for w in re.findall(r"\b[a-zA-Z]+\b", content)]
+                word_pattern = WORD_PATTERN_EN
+
+            # Lowercasing ASCII content once is cheaper than lowercasing every
+            # word. Elsewhere lowercasing can move word boundaries ("İ" turns
+            # into "i" and a combining dot), so other text goes word by word.
+            if content.isascii():
+                words = word_pattern.findall(content.lower())
+            else:
+                words = [word.lower() for word in word_pattern.findall(content)]
         except Exception as e:
             logger.warning(
                 f"Tokenization failed: {str(e)}, using fallback tokenization"
             )
             # Simple fallback tokenization
-            sentences = [s.strip() for s in re.split(r"[.!?]+", content) if s.strip()]
+            sentences = _split_sentences(content)
+            # \w matches any word character, so keep only alphabetic words (no
+            # numbers or punctuation) and filter out very short words here
             words = [
-                w.lower() for w in re.findall(r"\b\w+\b", content)
-            ]  # \w matches any word character
-
-        # Filter out punctuation, numbers, and stop words
-        filtered_words = [
-            word
-            for word in words
-            if word.isalpha()  # Only alphabetic words (no numbers or punctuation)
-            and word not in self.stop_words
-            and len(word) > 2  # Filter out very short words
-        ]
+                word
+                for word in map(str.lower, FALLBACK_WORD_PATTERN.findall(content))
+                if word.isalpha() and len(word) > 2
+            ]
+
+        # Filter out stop words
+        filtered_words = [word for word in words if word not in STOP_WORDS]
+
+        # Count the words once; every word statistic is derived from the counts
+        word_counts = Counter(filtered_words)
+        total_words = len(filtered_words)
 
         # Calculate lexical diversity
-        lexical_diversity = self._calculate_lexical_diversity(filtered_words)
+        lexical_diversity = self._calculate_lexical_diversity(word_counts, total_words)
 
         # Calculate fact density
         fact_density = self._calculate_fact_density(sentences)
 
         # Calculate concept density and extract key concepts
-        concept_density, key_concepts = self._calculate_concept_density(filtered_words)
-
-        # Calculate normalized score (1-10)
-        normalized_score = self._calculate_normalized_score(
-            lexical_diversity, fact_density, concept_density
+        concept_density, key_concepts = self._calculate_concept_density(
+            word_counts, total_words
         )
 
-        return {
-            "lexical_diversity": round(lexical_diversity, 3),
-            "fact_density": round(fact_density, 3),
-            "concept_density": round(concept_density, 3),
-            "key_concepts": key_concepts[:10],  # Return top 10 concepts
-            "normalized_score": round(normalized_score, 2),
-        }
+        return lexical_diversity, fact_density, concept_density, key_concepts
 
     def _is_likely_polish(self, content: str) -> bool:
         """
@@ -291,30 +475,28 @@ class InformationDensityAnalyzer:
         Returns:
             True if content is likely Polish, False otherwise
         """
-        # Polish-specific characters
-        polish_chars = set("ąćęłńóśźżĄĆĘŁŃÓŚŹŻ")
-
-        # Count Polish characters
-        polish_char_count = sum(1 for char in content if char in polish_chars)
+        # Count Polish characters; one str.count per character runs in C, which
+        # beats a Python-level loop over every character of the content
+        polish_char_count = sum(content.count(char) for char in POLISH_CHARS)
 
         # If more than 0.5% of characters are Polish-specific, consider it Polish
         return polish_char_count > len(content) * 0.005
 
-    def _calculate_lexical_diversity(self, words: List[str]) -> float:
+    def _calculate_lexical_diversity(self, word_counts: Counter, total_words: int) -> float:
         """
         Calculate lexical diversity as the ratio of unique words to total words.
 
         Args:
-            words: List of words in the content
+            word_counts: Counter of word frequencies in the content
+            total_words: Total number of words in the content
 
         Returns:
             Lexical diversity score (0-1)
         """
-        if not words:
+        if not total_words:
             return 0
 
-        unique_words = set(words)
-        return len(unique_words) / len(words)
+        return len(word_counts) / total_words
 
     def _calculate_fact_density(self, sentences: List[str]) -> float:
         """
@@ -329,42 +511,34 @@ class InformationDensityAnalyzer:
         if not sentences:
             return 0
 
-        factual_sentences = 0
-
-        for sentence in sentences:
-            # Check if sentence contains any factual patterns
-            is_factual = any(pattern.search(sentence) for pattern in self.fact_patterns)
-            if is_factual:
-                factual_sentences += 1
+        # Count sentences that contain any factual pattern
+        factual_sentences = sum(
+            1 for sentence in sentences if self.fact_regex.search(sentence)
+        )
 
         return factual_sentences / len(sentences)
 
-    def _calculate_concept_density(self, words: List[str]) -> Tuple[float, List[str]]:
+    def _calculate_concept_density(
+        self, word_counts: Counter, total_words: int
+    ) -> Tuple[float, List[str]]:
         """
         Calculate concept density and identify key concepts.
 
         Args:
-            words: List of words in the content
+            word_counts: Counter of word frequencies in the content
+            total_words: Total number of words in the content
 
         Returns:
             Tuple of (concept density score (0-1), list of key concepts)
         """
-        if not words:
+        if not total_words:
             return 0, []
 
-        # Count word frequencies
-        word_counts = Counter(words)
-
-        # Filter out words that appear only once
-        significant_words = {
-            word: count for word, count in word_counts.items() if count > 1
-        }
+        # Count the words that appear more than once
+        significant_words = sum(1 for count in word_counts.values() if count > 1)
 
         # Calculate concept density
-        if not words:
-            return 0, []
-
-        concept_density = len(significant_words) / len(set(words))
+        concept_density = significant_words / len(word_counts)
 
         # Extract key concepts (words with highest frequency)
         key_concepts = [word for word, _ in word_counts.most_common(10)]
@@ -387,9 +561,9 @@ class InformationDensityAnalyzer:
         """
         # Weight the components
         weighted_score = (
-            lexical_diversity * 0.4  # Lexical diversity is most important
-            + fact_density * 0.4  # Facts are equally important
-            + concept_density * 0.2  # Concept density is less important
+            lexical_diversity * LEXICAL_DIVERSITY_WEIGHT
+            + fact_density * FACT_DENSITY_WEIGHT
+            + concept_density * CONCEPT_DENSITY_WEIGHT
         )
 
         # Map to 1-10 scale (higher is better for information density)
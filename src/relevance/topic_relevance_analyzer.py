@@ -1,6 +1,5 @@
 import re
 import math
-import nltk
 from collections import Counter
 from typing import Dict, Any, List, Set, Tuple
 import logging
@@ -9,24 +8,6 @@ import json
 
 logger = logging.getLogger(__name__)
 
-# Create NLTK data directory if it doesn't exist
-nltk_data_dir = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "nltk_data"
-)
-os.makedirs(nltk_data_dir, exist_ok=True)
-
-# Set NLTK data path
-nltk.data.path.append(nltk_data_dir)
-
-# Download required NLTK resources
-try:
-    # Download punkt tokenizer
-    nltk.download("punkt", download_dir=nltk_data_dir, quiet=True)
-    logger.info("NLTK punkt tokenizer download complete")
-except Exception as e:
-    logger.warning(f"Failed to download NLTK resources: {str(e)}")
-    logger.warning("Will use simple tokenization as fallback")
-
 
 class TopicRelevanceAnalyzer:
     """
@@ -386,6 +367,10 @@ class TopicRelevanceAnalyzer:
         if total_words == 0:
             return {}
 
+        # The words are already lowercase; they are joined only once, and only
+        # if a multi-word keyword needs them
+        joined_words = None
+
         for topic_name, topic_data in self.topics.items():
             keywords = topic_data["keywords"]
             weight = topic_data["weight"]
@@ -396,7 +381,9 @@ class TopicRelevanceAnalyzer:
                 # Handle multi-word keywords
                 if " " in keyword:
                     # Simple check for multi-word phrases
-                    if keyword.lower() in " ".join(word_freq.elements()).lower():
+                    if joined_words is None:
+                        joined_words = " ".join(word_freq.elements())
+                    if keyword.lower() in joined_words:
                         match_count += 5  # Give higher weight to multi-word matches
                 else:
                     match_count += word_freq[keyword]